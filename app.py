@@ -3,15 +3,29 @@ import os
 import sys
 import time
 import argparse
+import asyncio
 import json
-from typing import List, Dict, Any, Tuple
-from statistics import median
-from web3 import Web3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Union
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON encode/decode
+    orjson = None
 
 DEFAULT_BLOCKS = int(os.getenv("GAS_SND_BLOCKS", "40"))
 DEFAULT_STEP = int(os.getenv("GAS_SND_STEP", "4"))
 DEFAULT_TOLERANCE_PCT = float(os.getenv("GAS_SND_TOLERANCE_PCT", "30.0"))
 DEFAULT_TIMEOUT = float(os.getenv("GAS_SND_TIMEOUT", "20.0"))
+MAX_CONCURRENT_REQUESTS = 32
+# extra blocks requested from eth_feeHistory('latest') so the sample window
+# stays covered if the tip moves between eth_blockNumber and eth_feeHistory
+FEE_HISTORY_SLACK_BLOCKS = 8
+# HTTP statuses meaning "no batches here"; anything else (notably 408/429) is
+# treated as a transport failure so a throttled endpoint is not hit per block
+BATCH_REJECTED_STATUSES = {400, 405, 413, 415}
 
 NETWORKS = {
     1: "Ethereum Mainnet",
@@ -31,24 +45,33 @@ def utc_now() -> str:
     return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
 
 
-def connect(rpc: str, timeout: float) -> Web3:
-    t0 = time.time()
-    w3 = Web3(Web3.HTTPProvider(rpc, request_kwargs={"timeout": timeout}))
-    if not w3.is_connected():
-        print(f"❌ Failed to connect to RPC: {rpc}", file=sys.stderr)
-        sys.exit(1)
-    try:
-        cid = int(w3.eth.chain_id)
-        head = int(w3.eth.block_number)
-        client = getattr(w3, "clientVersion", lambda: "unknown")()
-        dt = (time.time() - t0) * 1000
-        print(
-            f"🌐 Connected to {network_name(cid)} (chainId {cid}, tip {head}) via {client} in {dt:.0f} ms",
-            file=sys.stderr,
-        )
-    except Exception as e:
-        print(f"⚠️ Connected but failed to read chain info: {e}", file=sys.stderr)
-    return w3
+def json_loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _report_default(obj: Any) -> Dict[str, Any]:
+    # endpoint summaries are expanded one at a time while the report is written,
+    # so no second copy of all endpoint data is built up front
+    if isinstance(obj, EndpointSummary):
+        return {name: getattr(obj, name) for name in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps_report(payload: Dict[str, Any]) -> str:
+    if orjson is not None:
+        # passthrough so dataclasses go through _report_default and get sorted keys
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(payload, default=_report_default, option=option).decode()
+    return json.dumps(payload, indent=2, sort_keys=True, default=_report_default)
+
+
+def median_of_sorted(values: List[float]) -> float:
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
 
 
 def pct_diff(a: float, b: float) -> float:
@@ -57,38 +80,269 @@ def pct_diff(a: float, b: float) -> float:
     return (a - b) / b * 100.0
 
 
-def sample_base_fees(w3: Web3, blocks: int, step: int) -> Tuple[List[float], int, int, int]:
-    head = int(w3.eth.block_number)
+def parse_fee_history(fh: Dict[str, Any]) -> Dict[int, int]:
+    """Map block number -> baseFeePerGas (wei) from an eth_feeHistory result.
+
+    Nodes may cap blockCount, so the result can cover fewer blocks than requested.
+    """
+    oldest = int(fh["oldestBlock"], 16)
+    # baseFeePerGas carries one extra trailing entry for the block after the newest
+    fees = fh.get("baseFeePerGas") or []
+    count = min(len(fh.get("gasUsedRatio") or []), len(fees))
+    return {oldest + i: int(fees[i], 16) for i in range(count)}
+
+
+async def fetch_base_fees_batch(
+    session: aiohttp.ClientSession, rpc: str, nums: List[int]
+) -> Optional[Tuple[Dict[int, int], Any]]:
+    """Fetch baseFeePerGas (wei) for all `nums` in a single JSON-RPC batch.
+
+    Returns (base fees by block, first error), or None if the endpoint rejects
+    batch requests. Transport errors, timeouts and throttling (408/429) are not
+    retried block by block: every block is reported as failed.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": "eth_getBlockByNumber", "params": [hex(n), False]}
+        for i, n in enumerate(nums)
+    ]
+    try:
+        async with session.post(rpc, json=payload) as resp:
+            rejected = resp.status in BATCH_REJECTED_STATUSES
+            if not rejected:
+                resp.raise_for_status()
+                body = await resp.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return {}, str(e) or type(e).__name__
+    if not rejected:
+        try:
+            results = json_loads(body)
+        except ValueError:
+            results = None
+        # servers without batch support answer with a single error object
+        rejected = not isinstance(results, list)
+    if rejected:
+        print(f"⚠️ {rpc} rejected batch request; falling back to concurrent per-block fetch.", file=sys.stderr)
+        return None
+
+    bf_by_block: Dict[int, int] = {}
+    first_error = None
+    for r in results:
+        idx = r.get("id")
+        if not isinstance(idx, int) or not 0 <= idx < len(nums):
+            continue
+        blk = r.get("result")
+        if "error" in r or blk is None:
+            # rate-limited endpoints can fail many entries; sample_base_fees reports them once
+            first_error = first_error or r.get("error", "empty result")
+            continue
+        bf_by_block[nums[idx]] = int(blk.get("baseFeePerGas") or "0x0", 16)
+    return bf_by_block, first_error
+
+
+async def _rpc(
+    session: aiohttp.ClientSession, rpc: str, method: str, params: Optional[List[Any]] = None
+) -> Any:
+    req = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+    async with session.post(rpc, json=req) as resp:
+        resp.raise_for_status()
+        r = await resp.json(loads=json_loads, content_type=None)
+    if "error" in r or r.get("result") is None:
+        raise RuntimeError(f"{method}: {r.get('error', 'empty result')}")
+    return r["result"]
+
+
+def _client_session(timeout: float) -> aiohttp.ClientSession:
+    """Pooled keep-alive session shared by every call to one endpoint."""
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout))
+
+
+async def _sample_async(
+    session: aiohttp.ClientSession, rpc: str, nums: List[int]
+) -> Tuple[Dict[int, int], Any]:
+    """Fetch baseFeePerGas (wei) for `nums` with concurrent single-block requests.
+
+    Returns (base fees by block, first error).
+    """
+    # bound in-flight requests ourselves: aiohttp's total timeout also counts time
+    # spent queued for a pooled connection, so queued fetches would expire unsent
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _one(n: int) -> Any:
+        async with sem:
+            return await _rpc(session, rpc, "eth_getBlockByNumber", [hex(n), False])
+
+    results = await asyncio.gather(*[_one(n) for n in nums], return_exceptions=True)
+
+    bf_by_block: Dict[int, int] = {}
+    first_error = None
+    for n, blk in zip(nums, results):
+        if isinstance(blk, Exception):
+            # str() of a timeout is empty; fall back to the exception type
+            first_error = first_error or str(blk) or type(blk).__name__
+            continue
+        bf_by_block[n] = int(blk.get("baseFeePerGas") or "0x0", 16)
+    return bf_by_block, first_error
+
+
+async def probe_endpoint(
+    session: aiohttp.ClientSession, rpc: str, blocks: int
+) -> Tuple[int, int, str, Optional[Dict[int, int]]]:
+    """Connect to `rpc` and return (chain_id, head, client_version, fee_history).
+
+    All connect-time calls and the fee-history sample are issued concurrently.
+    fee_history maps block number -> base fee (wei) for the latest
+    `blocks + FEE_HISTORY_SLACK_BLOCKS` blocks, or is None if the endpoint does
+    not support eth_feeHistory or returns a malformed result. There is no
+    separate is_connected probe: the chainId/blockNumber calls serve that purpose.
+    """
+    t0 = time.time()
+    fh_count = hex(blocks + FEE_HISTORY_SLACK_BLOCKS)
+    cid_res, head_res, client_res, fh_res = await asyncio.gather(
+        _rpc(session, rpc, "eth_chainId"),
+        _rpc(session, rpc, "eth_blockNumber"),
+        _rpc(session, rpc, "web3_clientVersion"),
+        _rpc(session, rpc, "eth_feeHistory", [fh_count, "latest", []]),
+        return_exceptions=True,
+    )
+    for res in (cid_res, head_res):
+        if isinstance(res, (aiohttp.ClientError, asyncio.TimeoutError)):
+            print(f"❌ Failed to connect to RPC: {rpc}", file=sys.stderr)
+            sys.exit(1)
+        if isinstance(res, Exception):
+            print(f"⚠️ Connected but failed to read chain info: {res}", file=sys.stderr)
+            raise res
+    cid = int(cid_res, 16)
+    head = int(head_res, 16)
+    client = client_res if isinstance(client_res, str) else "unknown"
+    dt = (time.time() - t0) * 1000
+    print(
+        f"🌐 Connected to {network_name(cid)} (chainId {cid}, tip {head}) via {client} in {dt:.0f} ms",
+        file=sys.stderr,
+    )
+
+    if not isinstance(fh_res, Exception):
+        try:
+            return cid, head, client, parse_fee_history(fh_res)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            fh_res = RuntimeError(f"malformed eth_feeHistory result: {e!r}")
+    print(f"⚠️ eth_feeHistory unavailable on {rpc}: {fh_res}; falling back to block fetch.", file=sys.stderr)
+    return cid, head, client, None
+
+
+async def sample_base_fees(
+    session: aiohttp.ClientSession,
+    rpc: str,
+    head: int,
+    blocks: int,
+    step: int,
+    fee_history: Optional[Dict[int, int]],
+) -> Tuple[List[int], Optional[float], int, int]:
+    if fee_history:
+        newest = max(fee_history)
+        if head - FEE_HISTORY_SLACK_BLOCKS <= newest < head:
+            # load-balanced RPCs may answer eth_feeHistory from a node a few blocks
+            # behind; end the window there rather than batch-fetching the gap
+            head = newest
     start = max(0, head - blocks + 1)
-    base_fees: List[float] = []
-    sampled = 0
 
     print(
         f"🔍 Sampling base fees from blocks [{start}, {head}] every {step} block(s)…",
         file=sys.stderr,
     )
 
-    for n in range(head, start - 1, -step):
-        try:
-            blk = w3.eth.get_block(n)
-        except Exception as e:
-            print(f"⚠️ Failed to fetch block {n}: {e}", file=sys.stderr)
-            continue
-        bf_wei = int(blk.get("baseFeePerGas", 0) or 0)
-        if bf_wei == 0:
-            # some L2 / legacy networks may not have baseFeePerGas
-            continue
-        base_fees.append(float(Web3.from_wei(bf_wei, "gwei")))
-        sampled += 1
+    nums = list(range(head, start - 1, -step))
+    # blocks outside the prefetched fee history (or all of them, without it)
+    # are fetched individually
+    bf_by_block = fee_history or {}
+    missing = [n for n in nums if n not in bf_by_block]
+    if missing:
+        fetched = await fetch_base_fees_batch(session, rpc, missing)
+        if fetched is None:
+            fetched = await _sample_async(session, rpc, missing)
+        fetched_bf, first_error = fetched
+        bf_by_block.update(fetched_bf)
+        failures = len(missing) - len(fetched_bf)
+        if failures:
+            print(
+                f"⚠️ {failures}/{len(missing)} block fetches failed on {rpc} (first error: {first_error})",
+                file=sys.stderr,
+            )
 
-    return base_fees, head, start, sampled
+    base_fees_wei = [bf_by_block[n] for n in nums if n in bf_by_block]
+    # head is always the first sampled block, so its base fee comes for free
+    head_bf_gwei = bf_by_block[head] / 1e9 if head in bf_by_block else None
+    return base_fees_wei, head_bf_gwei, head, start
+
+
+def reduce_fees(base_fees_wei: List[int]) -> Tuple[float, float, float, int]:
+    """Reduce sampled base fees (wei) to (median, min, max) in gwei plus the sample count."""
+    # some L2 / legacy networks may not have baseFeePerGas
+    bf_sorted = sorted(bf for bf in base_fees_wei if bf > 0)
+    if not bf_sorted:
+        return 0.0, 0.0, 0.0, 0
+    # stay in integer wei while reducing; convert to gwei once for reporting.
+    # a single sort yields median, min and max without extra passes. timsort is
+    # already linear on flat or monotonic runs (quiet L2s), and at these sample
+    # sizes it beats a pure-Python quickselect.
+    return (
+        median_of_sorted(bf_sorted) / 1e9,
+        bf_sorted[0] / 1e9,
+        bf_sorted[-1] / 1e9,
+        len(bf_sorted),
+    )
 
 
-def analyze_endpoint(rpc: str, blocks: int, step: int, timeout: float) -> Dict[str, Any]:
-    w3 = connect(rpc, timeout=timeout)
-    chain_id = int(w3.eth.chain_id)
-    client_version = getattr(w3, "clientVersion", lambda: "unknown")()
-    base_fees, head, start, sampled = sample_base_fees(w3, blocks, step)
+@dataclass
+class EndpointSummary:
+    # explicit __slots__ (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "rpcUrl",
+        "chainId",
+        "network",
+        "clientVersion",
+        "head",
+        "start",
+        "requestedSpan",
+        "step",
+        "sampledBlocks",
+        "baseFeeMedianGwei",
+        "baseFeeMinGwei",
+        "baseFeeMaxGwei",
+        "headBaseFeeGwei",
+        "deviationPct",
+        "isOutlier",
+    )
+
+    rpcUrl: str
+    chainId: int
+    network: str
+    clientVersion: str
+    head: int
+    start: int
+    requestedSpan: int
+    step: int
+    sampledBlocks: int
+    baseFeeMedianGwei: float
+    baseFeeMinGwei: float
+    baseFeeMaxGwei: float
+    headBaseFeeGwei: Optional[float]
+    deviationPct: float
+    isOutlier: bool
+
+
+def analyze_endpoint(rpc: str, blocks: int, step: int, timeout: float) -> EndpointSummary:
+    return asyncio.run(_analyze_async(rpc, blocks, step, timeout))
+
+
+async def _analyze_async(rpc: str, blocks: int, step: int, timeout: float) -> EndpointSummary:
+    # one pooled session carries every call to this endpoint, probe through sampling
+    async with _client_session(timeout) as session:
+        chain_id, head, client_version, fee_history = await probe_endpoint(session, rpc, blocks)
+        base_fees_wei, head_bf_gwei, head, start = await sample_base_fees(
+            session, rpc, head, blocks, step, fee_history
+        )
+    med_bf, min_bf, max_bf, sampled = reduce_fees(base_fees_wei)
 
     if sampled == 0:
         print(
@@ -97,62 +351,57 @@ def analyze_endpoint(rpc: str, blocks: int, step: int, timeout: float) -> Dict[s
             file=sys.stderr,
         )
 
-    head_blk = None
-    head_bf_gwei = None
-    try:
-        head_blk = w3.eth.get_block(head)
-        head_bf_gwei = float(
-            Web3.from_wei(int(head_blk.get("baseFeePerGas", 0) or 0), "gwei")
-        )
-    except Exception:
-        pass
-
-    if base_fees:
-        med_bf = median(base_fees)
-        min_bf = min(base_fees)
-        max_bf = max(base_fees)
-    else:
-        med_bf = min_bf = max_bf = 0.0
-
-    return {
-        "rpcUrl": rpc,
-        "chainId": chain_id,
-        "network": network_name(chain_id),
-        "clientVersion": client_version,
-        "head": head,
-        "start": start,
-        "requestedSpan": blocks,
-        "step": step,
-        "sampledBlocks": sampled,
-        "baseFeeMedianGwei": round(med_bf, 3),
-        "baseFeeMinGwei": round(min_bf, 3),
-        "baseFeeMaxGwei": round(max_bf, 3),
-        "headBaseFeeGwei": round(head_bf_gwei, 3) if head_bf_gwei is not None else None,
-    }
+    return EndpointSummary(
+        rpcUrl=rpc,
+        chainId=chain_id,
+        network=network_name(chain_id),
+        clientVersion=client_version,
+        head=head,
+        start=start,
+        requestedSpan=blocks,
+        step=step,
+        sampledBlocks=sampled,
+        baseFeeMedianGwei=round(med_bf, 3),
+        baseFeeMinGwei=round(min_bf, 3),
+        baseFeeMaxGwei=round(max_bf, 3),
+        headBaseFeeGwei=round(head_bf_gwei, 3) if head_bf_gwei is not None else None,
+        # filled in by group_by_chain
+        deviationPct=0.0,
+        isOutlier=False,
+    )
 
 
-def group_by_chain(endpoints: List[Dict[str, Any]], tolerance_pct: float) -> Dict[str, Any]:
-    groups: Dict[int, Dict[str, Any]] = {}
+def group_by_chain(endpoints: List[EndpointSummary], tolerance_pct: float) -> Dict[str, Dict[str, Any]]:
+    # groups are keyed and shaped exactly as in the JSON report so they can be emitted as-is
+    groups: Dict[str, Dict[str, Any]] = {}
     for ep in endpoints:
-        cid = ep["chainId"]
-        groups.setdefault(cid, {"endpoints": [], "globalMedianBaseFeeGwei": 0.0})
-        groups[cid]["endpoints"].append(ep)
+        grp = groups.setdefault(
+            str(ep.chainId),
+            {
+                "chainId": ep.chainId,
+                "network": ep.network,
+                "globalMedianBaseFeeGwei": 0.0,
+                "endpoints": [],
+            },
+        )
+        grp["endpoints"].append(ep)
 
     # compute group medians and deviations
-    for cid, grp in groups.items():
-        med_values = [ep["baseFeeMedianGwei"] for ep in grp["endpoints"] if ep["baseFeeMedianGwei"] > 0]
+    for grp in groups.values():
+        medians = [ep.baseFeeMedianGwei for ep in grp["endpoints"]]
+        med_values = sorted(m for m in medians if m > 0)
         if med_values:
-            g_med = median(med_values)
+            g_med = median_of_sorted(med_values)
         else:
             g_med = 0.0
         grp["globalMedianBaseFeeGwei"] = round(g_med, 3)
-        for ep in grp["endpoints"]:
-            if g_med > 0 and ep["baseFeeMedianGwei"] > 0:
-                dev = pct_diff(ep["baseFeeMedianGwei"], g_med)
+        for ep, ep_med in zip(grp["endpoints"], medians):
+            if g_med > 0 and ep_med > 0:
+                dev = pct_diff(ep_med, g_med)
             else:
                 dev = 0.0
-            ep["deviationPct"] = round(dev, 2)
-            ep["isOutlier"] = abs(dev) >= tolerance_pct
+            ep.deviationPct = round(dev, 2)
+            ep.isOutlier = abs(dev) >= tolerance_pct
     return groups
 
 
@@ -244,18 +493,37 @@ def main() -> None:
     )
 
     t0 = time.time()
-    endpoints: List[Dict[str, Any]] = []
-    for rpc in rpc_list:
-        try:
-            ep_summary = analyze_endpoint(rpc, args.blocks, args.step, args.timeout)
-            endpoints.append(ep_summary)
-        except KeyboardInterrupt:
+    results: List[Optional[EndpointSummary]] = [None] * len(rpc_list)
+    # endpoints are independent and I/O-bound, so query them all in parallel.
+    # the executor is not used as a context manager: its __exit__ (and the
+    # interpreter's exit hook) would join workers still blocked on RPC timeouts.
+    ex = ThreadPoolExecutor(max_workers=min(32, len(rpc_list)))
+    futures = {
+        ex.submit(analyze_endpoint, rpc, args.blocks, args.step, args.timeout): i
+        for i, rpc in enumerate(rpc_list)
+    }
+    try:
+        for fut in as_completed(futures):
+            i = futures[fut]
+            rpc = rpc_list[i]
+            try:
+                results[i] = fut.result()
+            except SystemExit:
+                raise
+            except Exception as e:
+                print(f"⚠️ Failed to analyze RPC {rpc}: {e}", file=sys.stderr)
+    except (KeyboardInterrupt, SystemExit) as e:
+        if isinstance(e, KeyboardInterrupt):
             print("\n🛑 Aborted by user.", file=sys.stderr)
-            sys.exit(1)
-        except SystemExit:
-            raise
-        except Exception as e:
-            print(f"⚠️ Failed to analyze RPC {rpc}: {e}", file=sys.stderr)
+        ex.shutdown(wait=False, cancel_futures=True)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # exit without joining in-flight workers so the abort is immediate
+        os._exit(1)
+    ex.shutdown()
+
+    # report in input order regardless of completion order
+    endpoints = [ep for ep in results if ep is not None]
 
     if not endpoints:
         print("❌ No endpoints could be analyzed successfully.", file=sys.stderr)
@@ -275,19 +543,9 @@ def main() -> None:
                 "tolerancePct": args.tolerance_pct,
                 "timeoutSec": args.timeout,
             },
-            "groups": {
-                str(cid): {
-                    "chainId": cid,
-                    "network": grp["endpoints"][0]["network"]
-                    if grp["endpoints"]
-                    else network_name(cid),
-                    "globalMedianBaseFeeGwei": grp["globalMedianBaseFeeGwei"],
-                    "endpoints": grp["endpoints"],
-                }
-                for cid, grp in groups.items()
-            },
+            "groups": groups,
         }
-        print(json.dumps(payload, indent=2, sort_keys=True))
+        print(json_dumps_report(payload))
         return
 
     # Human-readable output
@@ -302,18 +560,18 @@ def main() -> None:
         print(f"=== {network_name(cid_int)} (chainId {cid_int}) ===")
         print(f"Global median base fee: {grp['globalMedianBaseFeeGwei']:.3f} Gwei")
         for ep in eps:
-            flag = "🚨" if ep["isOutlier"] else "✅"
-            dev = ep["deviationPct"]
-            bf_med = ep["baseFeeMedianGwei"]
-            head_bf = ep["headBaseFeeGwei"]
+            flag = "🚨" if ep.isOutlier else "✅"
+            dev = ep.deviationPct
+            bf_med = ep.baseFeeMedianGwei
+            head_bf = f"{ep.headBaseFeeGwei:.3f} Gwei" if ep.headBaseFeeGwei is not None else "n/a"
             print(
-                f"{flag} RPC: {ep['rpcUrl']}\n"
-                f"   client: {ep['clientVersion']}\n"
-                f"   sampledBlocks: {ep['sampledBlocks']} "
-                f"(range {ep['start']}..{ep['head']} step={ep['step']})\n"
+                f"{flag} RPC: {ep.rpcUrl}\n"
+                f"   client: {ep.clientVersion}\n"
+                f"   sampledBlocks: {ep.sampledBlocks} "
+                f"(range {ep.start}..{ep.head} step={ep.step})\n"
                 f"   median baseFee: {bf_med:.3f} Gwei "
-                f"(min={ep['baseFeeMinGwei']:.3f}, max={ep['baseFeeMaxGwei']:.3f})\n"
-                f"   head baseFee: {head_bf:.3f} Gwei\n"
+                f"(min={ep.baseFeeMinGwei:.3f}, max={ep.baseFeeMaxGwei:.3f})\n"
+                f"   head baseFee: {head_bf}\n"
                 f"   deviation from group median: {dev:+.2f}%"
             )
 